@@ -256,6 +256,8 @@ class ControlledGate(Gate):
         return self.ctrl_state < 2**self.num_ctrl_qubits - 1
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         return (
             isinstance(other, ControlledGate)
             and self.num_ctrl_qubits == other.num_ctrl_qubits
@@ -34,6 +34,9 @@ The circuit itself keeps this context.
 from __future__ import annotations
 
 import copy
+import copyreg
+import types
+import weakref
 from itertools import zip_longest
 from typing import List, Type
 
@@ -50,6 +53,62 @@ from .tools import pi_check
 
 _CUTOFF_PRECISION = 1e-10
 
+_PLAIN_STATE_CACHE = weakref.WeakKeyDictionary()
+
+
+def _has_plain_state(cls):
+    """Whether instances of ``cls`` keep their entire state in their ``__dict__`` and can be created
+    by a bare ``cls.__new__(cls)``, so that a shallow copy can be made by cloning the ``__dict__``,
+    rather than going through the pickle protocol."""
+    try:
+        return _PLAIN_STATE_CACHE[cls]
+    except KeyError:
+        pass
+    out = (
+        cls not in copyreg.dispatch_table
+        and cls.__reduce_ex__ is object.__reduce_ex__
+        and cls.__reduce__ is object.__reduce__
+        and getattr(cls, "__getstate__", None) is getattr(object, "__getstate__", None)
+        and not hasattr(cls, "__setstate__")
+        and not hasattr(cls, "__getnewargs__")
+        and not hasattr(cls, "__getnewargs_ex__")
+        and not any(base.__dict__.get("__slots__") for base in cls.__mro__)
+    )
+    _PLAIN_STATE_CACHE[cls] = out
+    return out
+
+
+def _copy_plain_state(instruction):
+    """Shallow copy of an instruction whose class passes :func:`_has_plain_state`.
+
+    This is equivalent to the default ``copy.copy(instruction)`` for such instances, but skips the
+    generic ``__reduce_ex__``/``_reconstruct`` machinery, which is a significant part of the cost of
+    copying instructions during circuit/DAG conversions."""
+    cls = type(instruction)
+    cpy = cls.__new__(cls)
+    cpy.__dict__.update(instruction.__dict__)
+    return cpy
+
+
+class _PlainStateCopy:
+    """Descriptor implementing :meth:`Instruction.__copy__`.
+
+    :func:`copy.copy` only falls back to the pickle protocol if the type has no ``__copy__``.  For
+    classes that fail :func:`_has_plain_state`, looking this up raises :exc:`AttributeError`, so
+    they are copied exactly as they would be by default.  Everything else uses
+    :func:`_copy_plain_state`."""
+
+    __slots__ = ()
+
+    def __get__(self, instance, owner=None):
+        if owner is None:
+            owner = type(instance)
+        if not _has_plain_state(owner):
+            raise AttributeError("__copy__")
+        if instance is None:
+            return _copy_plain_state
+        return types.MethodType(_copy_plain_state, instance)
+
 
 class Instruction(Operation):
     """Generic quantum instruction."""
@@ -175,6 +234,9 @@ class Instruction(Operation):
         Returns:
             bool: are self and other equal.
         """
+        if self is other:
+            # Common for singleton instances, and avoids comparing the definitions.
+            return True
         if (  # pylint: disable=too-many-boolean-expressions
             not isinstance(other, Instruction)
             or self.base_class is not other.base_class
@@ -469,11 +531,12 @@ class Instruction(Operation):
             This is a setter method, not an additive one.  Calling this multiple times will silently
             override any previously set condition; it does not stack.
         """
-        if not isinstance(classical, (ClassicalRegister, Clbit)):
+        is_bit = isinstance(classical, Clbit)
+        if not is_bit and not isinstance(classical, ClassicalRegister):
             raise CircuitError("c_if must be used with a classical register or classical bit")
         if val < 0:
             raise CircuitError("condition value should be non-negative")
-        if isinstance(classical, Clbit):
+        if is_bit:
             # Casting the conditional value as Boolean when
             # the classical condition is on a classical bit.
             val = bool(val)
@@ -497,9 +560,12 @@ class Instruction(Operation):
             cpy.name = name
         return cpy
 
+    __copy__ = _PlainStateCopy()
+
     def __deepcopy__(self, memo=None):
-        cpy = copy.copy(self)
-        cpy._params = copy.copy(self._params)
+        cpy = _copy_plain_state(self) if _has_plain_state(type(self)) else copy.copy(self)
+        # Parameters are shared, not deep copied; only the list itself is owned by the copy.
+        cpy._params = self._params.copy()
         if self._definition:
             cpy._definition = copy.deepcopy(self._definition, memo)
         return cpy
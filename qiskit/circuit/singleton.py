@@ -265,7 +265,14 @@ def _impl_init_subclass(
         instruction_class, *, create_default_singleton=True, additional_singletons=(), **kwargs
     ):
         super(base, instruction_class).__init_subclass__(**kwargs)
+        # The zero-argument fast path in `_SingletonMeta.__call__` reads this attribute directly, so
+        # it must always be set on the class itself; inheriting it from a singleton parent would
+        # return an instance of the wrong type.
+        instruction_class._singleton_default_instance = None
         if not create_default_singleton and not additional_singletons:
+            # Similarly, we must not allow key-based lookups to fall through to a parent's
+            # singletons.
+            instruction_class._singleton_static_lookup = {}
             return
 
         # If we're creating singleton instances, then the _type object_ needs a lookup mapping the
@@ -278,14 +285,16 @@ def _impl_init_subclass(
             # switch the type of an instance of `cls` to this.
             __slots__ = ()
 
-            # Class variables mapping singleton instances (as pointers) to the arguments used to
-            # create them, for use by `to_mutable` and `__reduce__`.  We're safe to use the `id` of
-            # (value of the pointer to) each object because they a) are singletons and b) have
-            # lifetimes tied to the type object in their `base_class`, so will not be garbage
-            # collected until the class no longer exists.  This is effectively faking out an entry
-            # in an instance dictionary, but this works without affecting the slots layout, and
-            # doesn't require that the object has an instance dictionary.
+            # Class variables keyed on singleton instances (as pointers).  `_singleton_init_arguments`
+            # holds the arguments used to create each instance, for use by `to_mutable`, and
+            # `_singleton_reductions` holds each instance's precomputed `__reduce__` tuple.  We're
+            # safe to use the `id` of (value of the pointer to) each object because they a) are
+            # singletons and b) have lifetimes tied to the type object in their `base_class`, so
+            # will not be garbage collected until the class no longer exists.  This is effectively
+            # faking out an entry in an instance dictionary, but this works without affecting the
+            # slots layout, and doesn't require that the object has an instance dictionary.
             _singleton_init_arguments = {}
+            _singleton_reductions = {}
 
             # Docstrings are all inherited, and we use more descriptive class methods to better
             # distinguish the `_Singleton` class (`singleton_class`) from the instruction class
@@ -295,13 +304,12 @@ def _impl_init_subclass(
             def __new__(singleton_class, *_args, **_kwargs):
                 raise TypeError(f"cannot create '{singleton_class.__name__}' instances")
 
-            @property
-            def base_class(self):
-                return instruction_class
-
-            @property
-            def mutable(self):
-                return False
+            # These are read very frequently (e.g. in every `Instruction.__eq__`, and by anything
+            # that needs to decide whether to call `to_mutable`), so they're plain class attributes
+            # rather than properties, making the lookup a simple type-dict hit.  They still can't
+            # be written to, because of the `__setattr__` override.
+            base_class = instruction_class
+            mutable = False
 
             def to_mutable(self):
                 args, kwargs = type(self)._singleton_init_arguments[id(self)]
@@ -317,16 +325,15 @@ def _impl_init_subclass(
                 return self
 
             def __deepcopy__(self, memo=None):
+                if memo is not None:
+                    # Record ourselves so any further references to this singleton within the same
+                    # deepcopy are resolved by `copy.deepcopy`'s memo check without calling back
+                    # into us.
+                    memo[id(self)] = self
                 return self
 
             def __reduce__(self):
-                # The principle is that the unpickle operation will first create the `base_class`
-                # type object just by re-importing its module so all the singletons are guaranteed
-                # to exist before we get to doing anything with these arguments.  All we then need
-                # to do is pass the init arguments to the base type object and its logic will return
-                # the singleton object.
-                args, kwargs = type(self)._singleton_init_arguments[id(self)]
-                return (functools.partial(instruction_class, **kwargs), args)
+                return type(self)._singleton_reductions[id(self)]
 
         # This is just to let the type name offer slightly more hint to what's going on if it ever
         # appears in an error message, so it says (e.g.) `_SingletonXGate`, not just `_Singleton`.
@@ -339,6 +346,18 @@ def _impl_init_subclass(
             out.__class__ = _Singleton
 
             _Singleton._singleton_init_arguments[id(out)] = (args, kwargs)
+            # The principle of pickling is that the unpickle operation will first create the
+            # `base_class` type object just by re-importing its module so all the singletons are
+            # guaranteed to exist before we get to doing anything with these arguments.  All we then
+            # need to do is pass the init arguments to the base type object and its logic will
+            # return the singleton object.  This never changes, so we build it once here.
+            if kwargs:
+                reduction = (functools.partial(instruction_class, **kwargs), args)
+            else:
+                # Avoid the `partial` wrapper in the common case (including the default singleton,
+                # which then hits the zero-argument fast path on unpickle).
+                reduction = (instruction_class, args)
+            _Singleton._singleton_reductions[id(out)] = reduction
             key = instruction_class._singleton_lookup_key(*args, **kwargs)
             if key is not None:
                 instruction_class._singleton_static_lookup[key] = out
@@ -347,7 +366,10 @@ def _impl_init_subclass(
         # This static lookup is only for singletons generated at class-description time.  A separate
         # lookup that manages an LRU or similar cache should be used for singletons created on
         # demand.  This static dictionary is separate to ensure that the class-requested singletons
-        # have lifetimes tied to the class object, while dynamic ones can be freed again.
+        # have lifetimes tied to the class object, while dynamic ones can be freed again.  For the
+        # same reason, it must hold strong references (not a `weakref.WeakValueDictionary`): nothing
+        # else keeps the `additional_singletons` instances alive, and they are only freed along with
+        # the class.  Lookups are already a single hash-map `get` on the constructor's key.
         if create_default_singleton:
             instruction_class._singleton_default_instance = _create_singleton_instance((), {})
         for class_args, class_kwargs in additional_singletons:
@@ -385,7 +407,9 @@ class _SingletonMeta(type(Instruction)):
             # idiomatic way of building gates during high-performance circuit construction.  If
             # there are any arguments or kwargs, we delegate to the overridable method to
             # determine the cache key to use for lookup.
-            return cls._singleton_default_instance
+            if (singleton := cls._singleton_default_instance) is not None:
+                return singleton
+            return super().__call__()
         if (key := cls._singleton_lookup_key(*args, **kwargs)) is not None:
             try:
                 singleton = cls._singleton_static_lookup.get(key)
@@ -586,9 +610,14 @@ def stdlib_singleton_key(*, num_ctrl_qubits: int = 0):
     """
 
     if num_ctrl_qubits:
+        # The all-defaults key is by far the most common, so build it once up front rather than
+        # normalising the control state and allocating a new tuple on every call.
+        default_key = (2**num_ctrl_qubits - 1,)
 
         def key(label=None, ctrl_state=None, *, duration=None, unit="dt", _base_label=None):
             if label is None and duration is None and unit == "dt" and _base_label is None:
+                if ctrl_state is None:
+                    return default_key
                 # Normalisation; we want all types for the control state to key the same.
                 ctrl_state = _ctrl_state_to_int(ctrl_state, num_ctrl_qubits)
                 return (ctrl_state,)
@@ -87,7 +87,8 @@ def circuit_to_dag(circuit, copy_operations=True, *, qubit_order=None, clbit_ord
 
     for instruction in circuit.data:
         op = instruction.operation
-        if copy_operations:
+        # Immutable (singleton) operations would return themselves from the deepcopy anyway.
+        if copy_operations and getattr(op, "mutable", True):
             op = copy.deepcopy(op)
         dagcircuit.apply_operation_back(op, instruction.qubits, instruction.clbits, check=False)
 
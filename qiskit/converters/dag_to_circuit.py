@@ -68,7 +68,8 @@ def dag_to_circuit(dag, copy_operations=True):
 
     for node in dag.topological_op_nodes():
         op = node.op
-        if copy_operations:
+        # Immutable (singleton) operations would return themselves from the deepcopy anyway.
+        if copy_operations and getattr(op, "mutable", True):
             op = copy.deepcopy(op)
         circuit._append(CircuitInstruction(op, node.qargs, node.cargs))
 
@@ -126,6 +126,21 @@ Right circuit:
 {qc2}"""
         raise self.failureException(msg)
 
+    def assertAllDistinct(self, objects, msg=None):
+        """Assert that no two of the given objects are the same object (in the sense of ``is``).
+
+        Args:
+            objects (Sequence): the objects to compare.
+            msg (str): return a custom message on failure.
+
+        Raises:
+            AssertionError: if any object appears more than once.
+        """
+        if len({id(obj) for obj in objects}) == len(objects):
+            return
+        error_msg = f"Objects are not all distinct: {objects!r}"
+        raise self.failureException(self._formatMessage(msg, error_msg))
+
     def assertDictAlmostEqual(
         self, dict1, dict2, delta=None, msg=None, places=None, default_value=0
     ):
@@ -14,11 +14,12 @@
 
 """Test Qiskit's Instruction class."""
 
+import copy
 import unittest.mock
 
 import numpy as np
 
-from qiskit.circuit import Gate
+from qiskit.circuit import ControlledGate, Gate
 from qiskit.circuit import Parameter
 from qiskit.circuit import Instruction, InstructionSet
 from qiskit.circuit import QuantumCircuit
@@ -397,6 +398,52 @@ class TestInstructions(QiskitTestCase):
 
         self.assertEqual(inst.params, [0, 1, 2])
 
+    def test_copy_keeps_custom_state(self):
+        """Verify that copies of instructions whose state is not entirely in their ``__dict__``
+        keep all of it."""
+
+        class SlottedGate(Gate):
+            """Gate with some of its state in a slot."""
+
+            __slots__ = ("extra",)
+
+            def __init__(self, extra):
+                super().__init__("slotted", 1, [])
+                self.extra = extra
+
+        class SlottedControlledGate(ControlledGate):
+            """Controlled gate with some of its state in a slot."""
+
+            __slots__ = ("extra",)
+
+            def __init__(self, extra):
+                super().__init__("cslotted", 2, [], num_ctrl_qubits=1, base_gate=HGate())
+                self.extra = extra
+
+        class NewArgsGate(Gate):
+            """Gate whose ``__new__`` requires an argument."""
+
+            def __new__(cls, extra):  # pylint: disable=unused-argument
+                return super().__new__(cls)
+
+            def __init__(self, extra):
+                super().__init__("newargs", 1, [])
+                self.extra = extra
+
+            def __getnewargs__(self):
+                return (self.extra,)
+
+        plain = Gate("plain", 1, [0.5], label="plain")
+        for gate in (plain, SlottedGate(3), SlottedControlledGate(3), NewArgsGate(3)):
+            for copier in (copy.copy, copy.deepcopy):
+                with self.subTest(gate=type(gate).__name__, copier=copier.__name__):
+                    copied = copier(gate)
+                    self.assertIsNot(copied, gate)
+                    self.assertIsInstance(copied, type(gate))
+                    self.assertEqual(copied.__dict__, gate.__dict__)
+                    self.assertEqual(getattr(copied, "extra", None), getattr(gate, "extra", None))
+                    self.assertEqual(copied, gate)
+
     def test_instance_of_instruction(self):
         """Test correct error message is raised when invalid instruction
         is passed to append"""
@@ -18,12 +18,9 @@ Tests for singleton gate behavior
 """
 
 import copy
-import io
 import pickle
 import sys
 import types
-import unittest.mock
-import uuid
 
 from qiskit.circuit.library import (
     HGate,
@@ -36,16 +33,80 @@ from qiskit.circuit.library import (
     XGate,
     C4XGate,
 )
+import qiskit.circuit
 from qiskit.circuit import Clbit, QuantumCircuit, QuantumRegister, ClassicalRegister
-from qiskit.circuit.singleton import SingletonGate, SingletonInstruction
+from qiskit.circuit.singleton import SingletonGate, SingletonInstruction, stdlib_singleton_key
 from qiskit.converters import dag_to_circuit, circuit_to_dag
 
 from qiskit.test.base import QiskitTestCase
 
 
-class TestSingletonGate(QiskitTestCase):
+def _dag_round_trip(gate_type, label=None, condition=False):
+    """Build a circuit containing a single ``gate_type`` instance (conditioned on a single-bit
+    register if ``condition`` is set), and return it along with the result of round-tripping it
+    through the DAG converters."""
+    num_qubits = gate_type().num_qubits
+    qc = QuantumCircuit(num_qubits, 1) if condition else QuantumCircuit(num_qubits)
+    gate = gate_type(label=label)
+    if condition:
+        gate = gate.c_if(qc.cregs[0], 0)
+    qc.append(gate, range(num_qubits))
+    return qc, dag_to_circuit(circuit_to_dag(qc))
+
+
+class _SingletonTestCase(QiskitTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # None of the tests need distinct bits or registers, so they can share these.
+        cls._shared_clbit = Clbit()
+        cls._qr = QuantumRegister(2, "qr")
+        cls._cr = ClassicalRegister(1, "cr")
+        cls._qc_template = QuantumCircuit(cls._qr, cls._cr)
+
+    def assertCondition(self, operation, classical, value):
+        """Assert that ``operation`` is conditioned on exactly the object ``classical`` having the
+        value ``value``."""
+        self.assertIsNotNone(operation.condition)
+        self.assertIs(operation.condition[0], classical)
+        self.assertEqual(operation.condition[1], value)
+
+
+class TestSingletonGate(_SingletonTestCase):
     """Qiskit SingletonGate tests."""
 
+    _ADDITIONAL_INPUTS = (
+        ((1,), {}),
+        ((2,), {"label": "x"}),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Pickle needs classes to be importable.  Some tests define classes that should only exist
+        # inside the test, which means we need a little magic to make them pretend-importable.
+        cls._dummy_module = types.ModuleType("_QISKIT_DUMMY_TEST_SINGLETON")
+        sys.modules[cls._dummy_module.__name__] = cls._dummy_module
+        cls.addClassCleanup(sys.modules.pop, cls._dummy_module.__name__, None)
+
+        # This is defined once for the whole class rather than in each test that uses it, since
+        # creating the class builds all its singleton instances.
+        class Discrete(SingletonGate, additional_singletons=cls._ADDITIONAL_INPUTS):
+            def __init__(self, n=0, label=None):
+                super().__init__("discrete", 1, [], label=label)
+                self.n = n
+
+            @staticmethod
+            def _singleton_lookup_key(n=0, label=None):  # pylint: disable=arguments-differ
+                # This is an atypical usage - in Qiskit standard gates, the `label` being set
+                # not-None should not generate a singleton, so should return a mutable instance.
+                return (n, label)
+
+        Discrete.__module__ = cls._dummy_module.__name__
+        Discrete.__qualname__ = Discrete.__name__
+        cls._dummy_module.Discrete = Discrete
+        cls._Discrete = Discrete
+
     def test_default_singleton(self):
         gate = HGate()
         new_gate = HGate()
@@ -63,7 +124,7 @@ class TestSingletonGate(QiskitTestCase):
 
     def test_condition_not_singleton(self):
         gate = HGate()
-        condition_gate = HGate().c_if(Clbit(), 0)
+        condition_gate = HGate().c_if(self._shared_clbit, 0)
         self.assertIsNot(gate, condition_gate)
 
     def test_raise_on_state_mutation(self):
@@ -71,15 +132,15 @@ class TestSingletonGate(QiskitTestCase):
         with self.assertRaises(TypeError):
             gate.label = "foo"
         with self.assertRaises(TypeError):
-            gate.condition = (Clbit(), 0)
+            gate.condition = (self._shared_clbit, 0)
 
     def test_labeled_condition(self):
         singleton_gate = HGate()
-        clbit = Clbit()
+        clbit = self._shared_clbit
         gate = HGate(label="conditionally special").c_if(clbit, 0)
         self.assertIsNot(singleton_gate, gate)
         self.assertEqual(gate.label, "conditionally special")
-        self.assertEqual(gate.condition, (clbit, 0))
+        self.assertCondition(gate, clbit, 0)
 
     def test_default_singleton_copy(self):
         gate = HGate()
@@ -92,6 +153,16 @@ class TestSingletonGate(QiskitTestCase):
         self.assertIsNot(gate, copied)
         self.assertEqual(gate, copied)
 
+    def test_shallow_copy(self):
+        gate = HGate()
+        self.assertIs(gate, copy.copy(gate))
+        label_gate = HGate(label="special")
+        copied = copy.copy(label_gate)
+        self.assertIsNot(label_gate, copied)
+        self.assertIs(type(label_gate), type(copied))
+        self.assertEqual(label_gate, copied)
+        self.assertTrue(copied.mutable)
+
     def test_label_copy_new(self):
         gate = HGate()
         label_gate = HGate(label="special")
@@ -100,34 +171,39 @@ class TestSingletonGate(QiskitTestCase):
         copied = gate.copy()
         copied_label = label_gate.copy()
         self.assertIs(gate, copied)
-        self.assertIsNot(copied, label_gate)
-        self.assertIsNot(copied_label, gate)
-        self.assertIsNot(copied_label, label_gate)
+        self.assertAllDistinct([copied, label_gate, copied_label])
         self.assertNotEqual(copied.label, label_gate.label)
         self.assertEqual(copied_label, label_gate)
         self.assertNotEqual(copied.label, "special")
         self.assertEqual(copied_label.label, "special")
 
     def test_condition_copy(self):
-        gate = HGate().c_if(Clbit(), 0)
+        gate = HGate().to_mutable()
+        gate.condition = (self._shared_clbit, 0)
         copied = gate.copy()
         self.assertIsNot(gate, copied)
         self.assertEqual(gate, copied)
 
     def test_condition_label_copy(self):
-        clbit = Clbit()
+        clbit = self._shared_clbit
         gate = HGate(label="conditionally special").c_if(clbit, 0)
         copied = gate.copy()
         self.assertIsNot(gate, copied)
         self.assertEqual(gate, copied)
         self.assertEqual(copied.label, "conditionally special")
-        self.assertEqual(copied.condition, (clbit, 0))
+        self.assertCondition(copied, clbit, 0)
 
     def test_deepcopy(self):
         gate = HGate()
         copied = copy.deepcopy(gate)
         self.assertIs(gate, copied)
 
+    def test_deepcopy_memo(self):
+        gate = HGate()
+        memo = {}
+        self.assertIs(gate, copy.deepcopy(gate, memo))
+        self.assertIs(memo[id(gate)], gate)
+
     def test_deepcopy_with_label(self):
         gate = HGate(label="special")
         copied = copy.deepcopy(gate)
@@ -136,19 +212,20 @@ class TestSingletonGate(QiskitTestCase):
         self.assertEqual(copied.label, "special")
 
     def test_deepcopy_with_condition(self):
-        gate = HGate().c_if(Clbit(), 0)
+        gate = HGate().to_mutable()
+        gate.condition = (self._shared_clbit, 0)
         copied = copy.deepcopy(gate)
         self.assertIsNot(gate, copied)
         self.assertEqual(gate, copied)
 
     def test_condition_label_deepcopy(self):
-        clbit = Clbit()
+        clbit = self._shared_clbit
         gate = HGate(label="conditionally special").c_if(clbit, 0)
         copied = copy.deepcopy(gate)
         self.assertIsNot(gate, copied)
         self.assertEqual(gate, copied)
         self.assertEqual(copied.label, "conditionally special")
-        self.assertEqual(copied.condition, (clbit, 0))
+        self.assertCondition(copied, clbit, 0)
 
     def test_label_deepcopy_new(self):
         gate = HGate()
@@ -158,9 +235,7 @@ class TestSingletonGate(QiskitTestCase):
         copied = copy.deepcopy(gate)
         copied_label = copy.deepcopy(label_gate)
         self.assertIs(gate, copied)
-        self.assertIsNot(copied, label_gate)
-        self.assertIsNot(copied_label, gate)
-        self.assertIsNot(copied_label, label_gate)
+        self.assertAllDistinct([copied, label_gate, copied_label])
         self.assertNotEqual(copied.label, label_gate.label)
         self.assertEqual(copied_label, label_gate)
         self.assertNotEqual(copied.label, "special")
@@ -174,52 +249,35 @@ class TestSingletonGate(QiskitTestCase):
         self.assertIsNot(ch.base_gate, singleton_gate)
 
     def test_round_trip_dag_conversion(self):
-        qc = QuantumCircuit(1)
-        gate = HGate()
-        qc.append(gate, [0])
-        dag = circuit_to_dag(qc)
-        out = dag_to_circuit(dag)
+        qc, out = _dag_round_trip(HGate)
         self.assertIs(qc.data[0].operation, out.data[0].operation)
 
     def test_round_trip_dag_conversion_with_label(self):
-        gate = HGate(label="special")
-        qc = QuantumCircuit(1)
-        qc.append(gate, [0])
-        dag = circuit_to_dag(qc)
-        out = dag_to_circuit(dag)
+        qc, out = _dag_round_trip(HGate, label="special")
         self.assertIsNot(qc.data[0].operation, out.data[0].operation)
         self.assertEqual(qc.data[0].operation, out.data[0].operation)
         self.assertEqual(out.data[0].operation.label, "special")
 
     def test_round_trip_dag_conversion_with_condition(self):
-        qc = QuantumCircuit(1, 1)
-        gate = HGate().c_if(qc.cregs[0], 0)
-        qc.append(gate, [0])
-        dag = circuit_to_dag(qc)
-        out = dag_to_circuit(dag)
+        qc, out = _dag_round_trip(HGate, condition=True)
         self.assertIsNot(qc.data[0].operation, out.data[0].operation)
         self.assertEqual(qc.data[0].operation, out.data[0].operation)
-        self.assertEqual(out.data[0].operation.condition, (qc.cregs[0], 0))
+        self.assertCondition(out.data[0].operation, qc.cregs[0], 0)
 
     def test_round_trip_dag_conversion_condition_label(self):
-        qc = QuantumCircuit(1, 1)
-        gate = HGate(label="conditionally special").c_if(qc.cregs[0], 0)
-        qc.append(gate, [0])
-        dag = circuit_to_dag(qc)
-        out = dag_to_circuit(dag)
+        qc, out = _dag_round_trip(HGate, label="conditionally special", condition=True)
         self.assertIsNot(qc.data[0].operation, out.data[0].operation)
         self.assertEqual(qc.data[0].operation, out.data[0].operation)
-        self.assertEqual(out.data[0].operation.condition, (qc.cregs[0], 0))
+        self.assertCondition(out.data[0].operation, qc.cregs[0], 0)
         self.assertEqual(out.data[0].operation.label, "conditionally special")
 
     def test_condition_via_instructionset(self):
         gate = HGate()
-        qr = QuantumRegister(2, "qr")
-        cr = ClassicalRegister(1, "cr")
-        circuit = QuantumCircuit(qr, cr)
+        qr, cr = self._qr, self._cr
+        circuit = self._qc_template.copy_empty_like()
         circuit.h(qr[0]).c_if(cr, 1)
         self.assertIsNot(gate, circuit.data[0].operation)
-        self.assertEqual(circuit.data[0].operation.condition, (cr, 1))
+        self.assertCondition(circuit.data[0].operation, cr, 1)
 
     def test_is_mutable(self):
         gate = HGate()
@@ -242,14 +300,14 @@ class TestSingletonGate(QiskitTestCase):
         mutable_gate.label = "foo"
         mutable_gate.duration = 3
         mutable_gate.unit = "s"
-        clbit = Clbit()
+        clbit = self._shared_clbit
         mutable_gate.condition = (clbit, 0)
         self.assertTrue(mutable_gate.mutable)
         self.assertIsNot(gate, mutable_gate)
         self.assertEqual(mutable_gate.label, "foo")
         self.assertEqual(mutable_gate.duration, 3)
         self.assertEqual(mutable_gate.unit, "s")
-        self.assertEqual(mutable_gate.condition, (clbit, 0))
+        self.assertCondition(mutable_gate, clbit, 0)
 
     def test_to_mutable_of_mutable_instance(self):
         gate = HGate(label="foo")
@@ -277,24 +335,25 @@ class TestSingletonGate(QiskitTestCase):
     def test_immutable_pickle(self):
         gate = SXGate()
         self.assertFalse(gate.mutable)
-        with io.BytesIO() as fd:
-            pickle.dump(gate, fd)
-            fd.seek(0)
-            copied = pickle.load(fd)
+        copied = pickle.loads(pickle.dumps(gate))
         self.assertFalse(copied.mutable)
         self.assertIs(copied, gate)
 
+    def test_default_singleton_pickle_is_class_reference(self):
+        # The default singleton should pickle as a bare reference to its class, not any state.
+        payload = pickle.dumps(SXGate())
+        self.assertNotIn(b"functools", payload)
+        self.assertNotIn(b"_label", payload)
+        self.assertIs(pickle.loads(payload), SXGate())
+
     def test_mutable_pickle(self):
         gate = SXGate()
-        clbit = Clbit()
+        clbit = self._shared_clbit
         condition_gate = gate.c_if(clbit, 0)
         self.assertIsNot(gate, condition_gate)
-        self.assertEqual(condition_gate.condition, (clbit, 0))
+        self.assertCondition(condition_gate, clbit, 0)
         self.assertTrue(condition_gate.mutable)
-        with io.BytesIO() as fd:
-            pickle.dump(condition_gate, fd)
-            fd.seek(0)
-            copied = pickle.load(fd)
+        copied = pickle.loads(pickle.dumps(condition_gate))
         self.assertEqual(copied, condition_gate)
         self.assertTrue(copied.mutable)
 
@@ -325,6 +384,32 @@ class TestSingletonGate(QiskitTestCase):
         self.assertEqual(gate.x, 1)
         self.assertIsNot(MyAbstractGate(1), MyAbstractGate(1))
 
+    def test_suppress_singleton_no_arguments(self):
+        class MyGate(SingletonGate, create_default_singleton=False):
+            def __init__(self, label=None):
+                super().__init__("my_gate", 1, [], label=label)
+
+        gate = MyGate()
+        self.assertTrue(gate.mutable)
+        self.assertIs(type(gate), MyGate)
+        self.assertIsNot(gate, MyGate())
+
+    def test_suppress_singleton_in_subclass(self):
+        class MyGate(SingletonGate):
+            def __init__(self, label=None):
+                super().__init__("my_gate", 1, [], label=label)
+
+            _singleton_lookup_key = stdlib_singleton_key()
+
+        class MyOtherGate(MyGate, create_default_singleton=False):
+            pass
+
+        self.assertIs(MyGate(), MyGate())
+        for gate in (MyOtherGate(), MyOtherGate(label=None)):
+            self.assertTrue(gate.mutable)
+            self.assertIs(type(gate), MyOtherGate)
+        self.assertIsNot(MyOtherGate(), MyOtherGate())
+
     def test_inherit_singleton(self):
         class Measure(SingletonInstruction):
             def __init__(self):
@@ -347,21 +432,7 @@ class TestSingletonGate(QiskitTestCase):
         self.assertIsNot(gate, HGate(label="label"))
 
     def test_additional_singletons(self):
-        additional_inputs = [
-            ((1,), {}),
-            ((2,), {"label": "x"}),
-        ]
-
-        class Discrete(SingletonGate, additional_singletons=additional_inputs):
-            def __init__(self, n=0, label=None):
-                super().__init__("discrete", 1, [], label=label)
-                self.n = n
-
-            @staticmethod
-            def _singleton_lookup_key(n=0, label=None):  # pylint: disable=arguments-differ
-                # This is an atypical usage - in Qiskit standard gates, the `label` being set
-                # not-None should not generate a singleton, so should return a mutable instance.
-                return (n, label)
+        Discrete = self._Discrete
 
         default = Discrete()
         self.assertIs(default, Discrete())
@@ -381,24 +452,15 @@ class TestSingletonGate(QiskitTestCase):
         self.assertEqual(two.n, 2)
         self.assertEqual(two.label, "x")
 
+        for args, kwargs in self._ADDITIONAL_INPUTS:
+            self.assertFalse(Discrete(*args, **kwargs).mutable)
+
         # This doesn't match any of the defined singletons, and we're checking that it's not
         # spuriously cached without us asking for it.
         self.assertIsNot(Discrete(2), Discrete(2))
 
     def test_additional_singletons_copy(self):
-        additional_inputs = [
-            ((1,), {}),
-            ((2,), {"label": "x"}),
-        ]
-
-        class Discrete(SingletonGate, additional_singletons=additional_inputs):
-            def __init__(self, n=0, label=None):
-                super().__init__("discrete", 1, [], label=label)
-                self.n = n
-
-            @staticmethod
-            def _singleton_lookup_key(n=0, label=None):  # pylint: disable=arguments-differ
-                return (n, label)
+        Discrete = self._Discrete
 
         default = Discrete()
         one = Discrete(1)
@@ -433,46 +495,26 @@ class TestSingletonGate(QiskitTestCase):
         self.assertIsNot(mutable, copy.deepcopy(mutable))
 
     def test_additional_singletons_pickle(self):
-        additional_inputs = [
-            ((1,), {}),
-            ((2,), {"label": "x"}),
-        ]
-
-        class Discrete(SingletonGate, additional_singletons=additional_inputs):
-            def __init__(self, n=0, label=None):
-                super().__init__("discrete", 1, [], label=label)
-                self.n = n
-
-            @staticmethod
-            def _singleton_lookup_key(n=0, label=None):  # pylint: disable=arguments-differ
-                return (n, label)
-
-        # Pickle needs the class to be importable.  We want the class to only be instantiated inside
-        # the test, which means we need a little magic to make it pretend-importable.
-        dummy_module = types.ModuleType("_QISKIT_DUMMY_" + str(uuid.uuid4()).replace("-", "_"))
-        dummy_module.Discrete = Discrete
-        Discrete.__module__ = dummy_module.__name__
-        Discrete.__qualname__ = Discrete.__name__
+        Discrete = self._Discrete
 
         default = Discrete()
         one = Discrete(1)
         two = Discrete(2, "x")
         mutable = Discrete(3)
 
-        with unittest.mock.patch.dict(sys.modules, {dummy_module.__name__: dummy_module}):
-            # The singletons in `additional_singletons` are statics; their lifetimes should be tied
-            # to the type object itself, so if we don't delete it, it should be eligible to be
-            # reloaded from and produce the exact instances.
-            self.assertIs(default, pickle.loads(pickle.dumps(default)))
-            self.assertEqual(default.n, 0)
-            self.assertIs(one, pickle.loads(pickle.dumps(one)))
-            self.assertEqual(one.n, 1)
-            self.assertIs(two, pickle.loads(pickle.dumps(two)))
-            self.assertEqual(two.n, 2)
-            self.assertIsNot(mutable, pickle.loads(pickle.dumps(mutable)))
+        # The singletons in `additional_singletons` are statics; their lifetimes should be tied to
+        # the type object itself, so if we don't delete it, it should be eligible to be reloaded
+        # from and produce the exact instances.
+        self.assertIs(default, pickle.loads(pickle.dumps(default)))
+        self.assertEqual(default.n, 0)
+        self.assertIs(one, pickle.loads(pickle.dumps(one)))
+        self.assertEqual(one.n, 1)
+        self.assertIs(two, pickle.loads(pickle.dumps(two)))
+        self.assertEqual(two.n, 2)
+        self.assertIsNot(mutable, pickle.loads(pickle.dumps(mutable)))
 
 
-class TestSingletonControlledGate(QiskitTestCase):
+class TestSingletonControlledGate(_SingletonTestCase):
     """Qiskit SingletonGate tests."""
 
     def test_default_singleton(self):
@@ -487,7 +529,7 @@ class TestSingletonControlledGate(QiskitTestCase):
 
     def test_condition_not_singleton(self):
         gate = CZGate()
-        condition_gate = CZGate().c_if(Clbit(), 0)
+        condition_gate = CZGate().c_if(self._shared_clbit, 0)
         self.assertIsNot(gate, condition_gate)
 
     def test_raise_on_state_mutation(self):
@@ -495,15 +537,15 @@ class TestSingletonControlledGate(QiskitTestCase):
         with self.assertRaises(TypeError):
             gate.label = "foo"
         with self.assertRaises(TypeError):
-            gate.condition = (Clbit(), 0)
+            gate.condition = (self._shared_clbit, 0)
 
     def test_labeled_condition(self):
         singleton_gate = CSwapGate()
-        clbit = Clbit()
+        clbit = self._shared_clbit
         gate = CSwapGate(label="conditionally special").c_if(clbit, 0)
         self.assertIsNot(singleton_gate, gate)
         self.assertEqual(gate.label, "conditionally special")
-        self.assertEqual(gate.condition, (clbit, 0))
+        self.assertCondition(gate, clbit, 0)
 
     def test_default_singleton_copy(self):
         gate = CXGate()
@@ -524,28 +566,27 @@ class TestSingletonControlledGate(QiskitTestCase):
         copied = gate.copy()
         copied_label = label_gate.copy()
         self.assertIs(gate, copied)
-        self.assertIsNot(copied, label_gate)
-        self.assertIsNot(copied_label, gate)
-        self.assertIsNot(copied_label, label_gate)
+        self.assertAllDistinct([copied, label_gate, copied_label])
         self.assertNotEqual(copied.label, label_gate.label)
         self.assertEqual(copied_label, label_gate)
         self.assertNotEqual(copied.label, "special")
         self.assertEqual(copied_label.label, "special")
 
     def test_condition_copy(self):
-        gate = CZGate().c_if(Clbit(), 0)
+        gate = CZGate().to_mutable()
+        gate.condition = (self._shared_clbit, 0)
         copied = gate.copy()
         self.assertIsNot(gate, copied)
         self.assertEqual(gate, copied)
 
     def test_condition_label_copy(self):
-        clbit = Clbit()
+        clbit = self._shared_clbit
         gate = CZGate(label="conditionally special").c_if(clbit, 0)
         copied = gate.copy()
         self.assertIsNot(gate, copied)
         self.assertEqual(gate, copied)
         self.assertEqual(copied.label, "conditionally special")
-        self.assertEqual(copied.condition, (clbit, 0))
+        self.assertCondition(copied, clbit, 0)
 
     def test_deepcopy(self):
         gate = CXGate()
@@ -565,19 +606,20 @@ class TestSingletonControlledGate(QiskitTestCase):
         self.assertNotEqual(singleton_gate.label, copied.label)
 
     def test_deepcopy_with_condition(self):
-        gate = CCXGate().c_if(Clbit(), 0)
+        gate = CCXGate().to_mutable()
+        gate.condition = (self._shared_clbit, 0)
         copied = copy.deepcopy(gate)
         self.assertIsNot(gate, copied)
         self.assertEqual(gate, copied)
 
     def test_condition_label_deepcopy(self):
-        clbit = Clbit()
+        clbit = self._shared_clbit
         gate = CHGate(label="conditionally special").c_if(clbit, 0)
         copied = copy.deepcopy(gate)
         self.assertIsNot(gate, copied)
         self.assertEqual(gate, copied)
         self.assertEqual(copied.label, "conditionally special")
-        self.assertEqual(copied.condition, (clbit, 0))
+        self.assertCondition(copied, clbit, 0)
 
     def test_label_deepcopy_new(self):
         gate = CHGate()
@@ -587,9 +629,7 @@ class TestSingletonControlledGate(QiskitTestCase):
         copied = copy.deepcopy(gate)
         copied_label = copy.deepcopy(label_gate)
         self.assertIs(gate, copied)
-        self.assertIsNot(copied, label_gate)
-        self.assertIsNot(copied_label, gate)
-        self.assertIsNot(copied_label, label_gate)
+        self.assertAllDistinct([copied, label_gate, copied_label])
         self.assertNotEqual(copied.label, label_gate.label)
         self.assertEqual(copied_label, label_gate)
         self.assertNotEqual(copied.label, "special")
@@ -603,52 +643,35 @@ class TestSingletonControlledGate(QiskitTestCase):
         self.assertIsNot(ch.base_gate, singleton_gate)
 
     def test_round_trip_dag_conversion(self):
-        qc = QuantumCircuit(2)
-        gate = CHGate()
-        qc.append(gate, [0, 1])
-        dag = circuit_to_dag(qc)
-        out = dag_to_circuit(dag)
+        qc, out = _dag_round_trip(CHGate)
         self.assertIs(qc.data[0].operation, out.data[0].operation)
 
     def test_round_trip_dag_conversion_with_label(self):
-        gate = CHGate(label="special")
-        qc = QuantumCircuit(2)
-        qc.append(gate, [0, 1])
-        dag = circuit_to_dag(qc)
-        out = dag_to_circuit(dag)
+        qc, out = _dag_round_trip(CHGate, label="special")
         self.assertIsNot(qc.data[0].operation, out.data[0].operation)
         self.assertEqual(qc.data[0].operation, out.data[0].operation)
         self.assertEqual(out.data[0].operation.label, "special")
 
     def test_round_trip_dag_conversion_with_condition(self):
-        qc = QuantumCircuit(2, 1)
-        gate = CHGate().c_if(qc.cregs[0], 0)
-        qc.append(gate, [0, 1])
-        dag = circuit_to_dag(qc)
-        out = dag_to_circuit(dag)
+        qc, out = _dag_round_trip(CHGate, condition=True)
         self.assertIsNot(qc.data[0].operation, out.data[0].operation)
         self.assertEqual(qc.data[0].operation, out.data[0].operation)
-        self.assertEqual(out.data[0].operation.condition, (qc.cregs[0], 0))
+        self.assertCondition(out.data[0].operation, qc.cregs[0], 0)
 
     def test_round_trip_dag_conversion_condition_label(self):
-        qc = QuantumCircuit(2, 1)
-        gate = CHGate(label="conditionally special").c_if(qc.cregs[0], 0)
-        qc.append(gate, [0, 1])
-        dag = circuit_to_dag(qc)
-        out = dag_to_circuit(dag)
+        qc, out = _dag_round_trip(CHGate, label="conditionally special", condition=True)
         self.assertIsNot(qc.data[0].operation, out.data[0].operation)
         self.assertEqual(qc.data[0].operation, out.data[0].operation)
-        self.assertEqual(out.data[0].operation.condition, (qc.cregs[0], 0))
+        self.assertCondition(out.data[0].operation, qc.cregs[0], 0)
         self.assertEqual(out.data[0].operation.label, "conditionally special")
 
     def test_condition_via_instructionset(self):
         gate = CHGate()
-        qr = QuantumRegister(2, "qr")
-        cr = ClassicalRegister(1, "cr")
-        circuit = QuantumCircuit(qr, cr)
+        qr, cr = self._qr, self._cr
+        circuit = self._qc_template.copy_empty_like()
         circuit.h(qr[0]).c_if(cr, 1)
         self.assertIsNot(gate, circuit.data[0].operation)
-        self.assertEqual(circuit.data[0].operation.condition, (cr, 1))
+        self.assertCondition(circuit.data[0].operation, cr, 1)
 
     def test_is_mutable(self):
         gate = CXGate()
@@ -671,14 +694,14 @@ class TestSingletonControlledGate(QiskitTestCase):
         mutable_gate.label = "foo"
         mutable_gate.duration = 3
         mutable_gate.unit = "s"
-        clbit = Clbit()
+        clbit = self._shared_clbit
         mutable_gate.condition = (clbit, 0)
         self.assertTrue(mutable_gate.mutable)
         self.assertIsNot(gate, mutable_gate)
         self.assertEqual(mutable_gate.label, "foo")
         self.assertEqual(mutable_gate.duration, 3)
         self.assertEqual(mutable_gate.unit, "s")
-        self.assertEqual(mutable_gate.condition, (clbit, 0))
+        self.assertCondition(mutable_gate, clbit, 0)
 
     def test_to_mutable_of_mutable_instance(self):
         gate = CZGate(label="foo")
@@ -704,28 +727,28 @@ class TestSingletonControlledGate(QiskitTestCase):
     def test_inner_outer_label_with_c_if(self):
         inner_gate = HGate(label="my h gate")
         controlled_gate = inner_gate.control(label="foo")
-        clbit = Clbit()
+        clbit = self._shared_clbit
         conditonal_controlled_gate = controlled_gate.c_if(clbit, 0)
         self.assertTrue(conditonal_controlled_gate.mutable)
         self.assertEqual("my h gate", conditonal_controlled_gate.base_gate.label)
         self.assertEqual("foo", conditonal_controlled_gate.label)
-        self.assertEqual((clbit, 0), conditonal_controlled_gate.condition)
+        self.assertCondition(conditonal_controlled_gate, clbit, 0)
 
     def test_inner_outer_label_with_c_if_deepcopy(self):
         inner_gate = XGate(label="my h gate")
         controlled_gate = inner_gate.control(label="foo")
-        clbit = Clbit()
+        clbit = self._shared_clbit
         conditonal_controlled_gate = controlled_gate.c_if(clbit, 0)
         self.assertTrue(conditonal_controlled_gate.mutable)
         self.assertEqual("my h gate", conditonal_controlled_gate.base_gate.label)
         self.assertEqual("foo", conditonal_controlled_gate.label)
-        self.assertEqual((clbit, 0), conditonal_controlled_gate.condition)
+        self.assertCondition(conditonal_controlled_gate, clbit, 0)
         copied = copy.deepcopy(conditonal_controlled_gate)
         self.assertIsNot(conditonal_controlled_gate, copied)
         self.assertTrue(copied.mutable)
         self.assertEqual("my h gate", copied.base_gate.label)
         self.assertEqual("foo", copied.label)
-        self.assertEqual((clbit, 0), copied.condition)
+        self.assertCondition(copied, clbit, 0)
 
     def test_inner_outer_label_pickle(self):
         inner_gate = XGate(label="my h gate")
@@ -733,10 +756,7 @@ class TestSingletonControlledGate(QiskitTestCase):
         self.assertTrue(controlled_gate.mutable)
         self.assertEqual("my h gate", controlled_gate.base_gate.label)
         self.assertEqual("foo", controlled_gate.label)
-        with io.BytesIO() as fd:
-            pickle.dump(controlled_gate, fd)
-            fd.seek(0)
-            copied = pickle.load(fd)
+        copied = pickle.loads(pickle.dumps(controlled_gate))
         self.assertIsNot(controlled_gate, copied)
         self.assertTrue(copied.mutable)
         self.assertEqual("my h gate", copied.base_gate.label)
@@ -760,3 +780,37 @@ class TestSingletonControlledGate(QiskitTestCase):
         self.assertIs(C4XGate(), C4XGate(ctrl_state=15))
         self.assertIs(C4XGate(), C4XGate(ctrl_state="1111"))
         self.assertIsNot(C4XGate(), C4XGate(ctrl_state=0))
+
+
+class TestSingletonInstruction(QiskitTestCase):
+    """Qiskit SingletonInstruction tests."""
+
+    def test_measure_reset_singleton(self):
+        for instruction_type in (qiskit.circuit.Measure, qiskit.circuit.Reset):
+            with self.subTest(instruction_type=instruction_type):
+                instruction = instruction_type()
+                self.assertIs(instruction, instruction_type())
+                self.assertIsInstance(instruction, SingletonInstruction)
+                self.assertFalse(instruction.mutable)
+                self.assertIsNot(instruction, instruction_type(label="special"))
+
+    def test_measure_subclass_with_required_arguments(self):
+        # Subclasses are singletons by default, so the default instance is created with no
+        # arguments when the class is defined.
+        with self.assertRaises(TypeError):
+
+            class _BadBasisMeasure(qiskit.circuit.Measure):
+                def __init__(self, basis):
+                    super().__init__()
+                    self.basis = basis
+
+        class BasisMeasure(qiskit.circuit.Measure, create_default_singleton=False):
+            def __init__(self, basis):
+                super().__init__()
+                self.basis = basis
+
+        measure = BasisMeasure("X")
+        self.assertEqual(measure.basis, "X")
+        self.assertTrue(measure.mutable)
+        self.assertIsNot(measure, BasisMeasure("X"))
+        self.assertIs(measure.base_class, BasisMeasure)
@@ -13,6 +13,7 @@
 """UnitaryGate tests"""
 
 import json
+import pickle
 import numpy
 from numpy.testing import assert_allclose
 
@@ -66,6 +67,18 @@ class TestUnitaryGate(QiskitTestCase):
         uni = UnitaryGate([[0, 1j], [-1j, 0]])
         self.assertTrue(numpy.array_equal(uni.adjoint().to_matrix(), uni.to_matrix()))
 
+    def test_pickle_out_of_band(self):
+        """test the matrix is serialized out-of-band with pickle protocol 5"""
+        matrix = random_unitary(32, seed=42).data
+        uni = UnitaryGate(matrix)
+        buffers = []
+        payload = pickle.dumps(uni, protocol=5, buffer_callback=buffers.append)
+        self.assertGreater(len(buffers), 0)
+        self.assertLess(len(payload), matrix.nbytes)
+        copied = pickle.loads(payload, buffers=buffers)
+        self.assertEqual(uni, copied)
+        assert_allclose(copied.to_matrix(), matrix)
+
 
 class TestUnitaryCircuit(QiskitTestCase):
     """Matrix gate circuit tests."""